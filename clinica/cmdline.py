@@ -3,16 +3,15 @@
 The aim of this module is to execute pipelines from the command line,
 and gives to the user some other utils to work with the pipelines.
 """
+
+import importlib
 import os
 import sys
+from typing import Optional
 
 import click
 
 import clinica
-from clinica.converters.cli import cli as convert_cli
-from clinica.engine.template import cli as generate_cli
-from clinica.iotools.cli import cli as iotools_cli
-from clinica.pipelines.cli import cli as run_cli
 from clinica.utils.exceptions import ClinicaException
 from clinica.utils.stream import cprint
 
@@ -46,11 +45,13 @@ def setup_logging(verbose: bool = False) -> None:
 def setup_nipype_logging():
     """Monkey-patch nipype to use Python's RFH logger."""
     import logging
+    from functools import partial
     from logging.handlers import RotatingFileHandler as RFHandler
 
     import nipype
 
-    nipype.utils.logger.RFHandler = RFHandler
+    # Only create pypeline.log once nipype actually emits a record.
+    nipype.utils.logger.RFHandler = partial(RFHandler, delay=True)
     # Setup debug logging to file.
     nipype.config.enable_debug_mode()
     nipype.config.update_config(
@@ -67,6 +68,10 @@ def setup_nipype_logging():
     nipype_logger = logging.getLogger("nipype")
     nipype_logger.removeHandler(nipype_logger.handlers[0])
     nipype_logger.addHandler(logging.NullHandler())
+    # The file handler is attached to each nipype logger, so there is no
+    # point in walking every record up the logger hierarchy as well.
+    for logger in nipype.logging.loggers.values():
+        logger.propagate = False
 
 
 def setup_clinica_logging(logging_level: str):
@@ -95,19 +100,76 @@ def setup_clinica_logging(logging_level: str):
         clinica_logger.addHandler(console_handler)
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+class LazyGroup(click.Group):
+    """CLI group which imports its subcommands only when they are requested.
+
+    Sub-commands are declared with a mapping from their name to a tuple
+    (import path, short help). The import path has the form "module:attribute".
+    The short help is used for listing the commands with `clinica -h`
+    such that no sub-command module needs to be imported to display it.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[dict] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(list(super().list_commands(ctx)) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        rows = [
+            (
+                (name, self.lazy_subcommands[name][1])
+                if name in self.lazy_subcommands
+                else (name, self.commands[name].get_short_help_str())
+            )
+            for name in self.list_commands(ctx)
+        ]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {import_path} failed by returning a non-command object."
+            )
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    context_settings=CONTEXT_SETTINGS,
+    lazy_subcommands={
+        "convert": (
+            "clinica.converters.cli:cli",
+            "Convert popular neuroimaging datasets to the BIDS format.",
+        ),
+        "generate": (
+            "clinica.engine.template:cli",
+            "Instantiate a new pipeline from available templates.",
+        ),
+        "iotools": ("clinica.iotools.cli:cli", "Tools to handle BIDS/CAPS datasets."),
+        "run": (
+            "clinica.pipelines.cli:cli",
+            "Run pipelines on BIDS and CAPS datasets.",
+        ),
+    },
+)
 @click.version_option(version=clinica.__version__)
 @click.option("-v", "--verbose", is_flag=True, help="Increase logging verbosity.")
 def cli(verbose: bool) -> None:
     setup_logging(verbose=verbose)
 
 
-cli.add_command(convert_cli)
-cli.add_command(generate_cli)
-cli.add_command(iotools_cli)
-cli.add_command(run_cli)
-
-
 def main() -> None:
     try:
         cli()
@@ -63,7 +63,7 @@ def convert(
         )
         write_scans(bids_dir=bids_dir, participant=participant)
 
-    if list(bids_dir.rglob("dwi")):
+    if any(bids_dir.glob("sub-*/ses-*/dwi")):
         write_dwi_b_values(bids_dir=bids_dir)
 
     readme_data = {
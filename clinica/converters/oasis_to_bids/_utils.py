@@ -304,13 +304,13 @@ def write_scans_tsv(bids_dir: Path) -> None:
     ----------
     bids_dir : Path to the BIDS output
     """
-    for subject_path in bids_dir.rglob("sub-*"):
+    for subject_path in bids_dir.glob("sub-*"):
         if subject_path.is_dir():
             to_write = pd.DataFrame(
                 {
                     "filename": [
                         f"{path.parent.name}/{path.name}"
-                        for path in subject_path.rglob("*ses-M000*.nii.gz")
+                        for path in subject_path.glob("ses-M000/*/*ses-M000*.nii.gz")
                     ]
                 }
             )
@@ -1,21 +1,3 @@
-from .. import pydra  # noqa
-from . import (
-    deeplearning_prepare_data,
-    dwi,
-    machine_learning,
-    machine_learning_spatial_svm,
-    pet,
-    pet_surface,
-    statistics_surface,
-    statistics_volume,
-    statistics_volume_correction,
-    anatomical,
-    t1_linear,
-    t1_volume,
-    t1_volume_create_dartel,
-    t1_volume_dartel2mni,
-    t1_volume_existing_template,
-    t1_volume_parcellation,
-    t1_volume_register_dartel,
-    t1_volume_tissue_segmentation,
-)
+# Pipelines are registered as `clinica run` sub-commands when their CLI
+# module is imported. This is done on demand by `clinica.pipelines.cli`
+# to avoid importing all pipelines when a single one is needed.
@@ -89,7 +89,6 @@ class T1FreeSurferTemplate(Pipeline):
             save_part_sess_long_ids_to_tsv,
         )
         from clinica.utils.exceptions import ClinicaCAPSError, ClinicaException
-        from clinica.utils.filemanip import extract_subjects_sessions_from_filename
         from clinica.utils.input_files import T1_FS_DESTRIEUX
         from clinica.utils.inputs import clinica_file_filter
         from clinica.utils.longitudinal import (
@@ -130,9 +129,6 @@ class T1FreeSurferTemplate(Pipeline):
                 )
             else:
                 cprint("Participant(s) will be ignored by Clinica.", lvl="warning")
-                input_ids = [
-                    f"{p_id}_{s_id}" for p_id, s_id in zip(self.subjects, self.sessions)
-                ]
                 processed_sessions_per_participant = [
                     read_sessions(self.caps_directory, p_id, l_id)
                     for (p_id, l_id) in zip(
@@ -142,13 +138,16 @@ class T1FreeSurferTemplate(Pipeline):
                 participants, sessions = unique_subjects_sessions_to_subjects_sessions(
                     processed_participants, processed_sessions_per_participant
                 )
-                processed_ids = [
+                processed_ids = {
                     f"{p_id}_{s_id}" for p_id, s_id in zip(participants, sessions)
+                }
+                to_process = [
+                    (p_id, s_id)
+                    for p_id, s_id in zip(self.subjects, self.sessions)
+                    if f"{p_id}_{s_id}" not in processed_ids
                 ]
-                to_process_ids = list(set(input_ids) - set(processed_ids))
-                self.subjects, self.sessions = extract_subjects_sessions_from_filename(
-                    to_process_ids
-                )
+                self.subjects = [p_id for p_id, _ in to_process]
+                self.sessions = [s_id for _, s_id in to_process]
 
         _, self.subjects, self.sessions = clinica_file_filter(
             self.subjects, self.sessions, self.caps_directory, T1_FS_DESTRIEUX
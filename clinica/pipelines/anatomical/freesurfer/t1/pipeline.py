@@ -92,10 +92,7 @@ class T1FreeSurfer(Pipeline):
             are_images_centered_around_origin_of_world_coordinate_system,
         )
         from clinica.utils.exceptions import ClinicaException
-        from clinica.utils.filemanip import (
-            extract_subjects_sessions_from_filename,
-            save_participants_sessions,
-        )
+        from clinica.utils.filemanip import save_participants_sessions
         from clinica.utils.input_files import T1W_NII
         from clinica.utils.inputs import clinica_file_filter
         from clinica.utils.stream import cprint
@@ -122,13 +119,14 @@ class T1FreeSurfer(Pipeline):
                 )
             else:
                 cprint(msg="Image(s) will be ignored by Clinica.", lvl="warning")
-                input_ids = [
-                    f"{p_id}_{s_id}" for p_id, s_id in zip(self.subjects, self.sessions)
+                processed_ids = set(processed_ids)
+                to_process = [
+                    (p_id, s_id)
+                    for p_id, s_id in zip(self.subjects, self.sessions)
+                    if f"{p_id}_{s_id}" not in processed_ids
                 ]
-                to_process_ids = list(set(input_ids) - set(processed_ids))
-                self.subjects, self.sessions = extract_subjects_sessions_from_filename(
-                    to_process_ids
-                )
+                self.subjects = [p_id for p_id, _ in to_process]
+                self.sessions = [s_id for _, s_id in to_process]
 
         t1w_files, self.subjects, self.sessions = clinica_file_filter(
             self.subjects, self.sessions, self.bids_directory, T1W_NII
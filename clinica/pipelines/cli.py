@@ -1,12 +1,101 @@
+import importlib
+
 import click
 
+# Modules implementing the CLI of each pipeline, indexed by command name.
+# This allows `clinica run <pipeline>` to import only the selected pipeline
+# instead of discovering all of them on every invocation.
+PIPELINE_MODULES = {
+    "t1-freesurfer": "clinica.pipelines.anatomical.freesurfer.t1.cli",
+    "t1-freesurfer-longitudinal": "clinica.pipelines.anatomical.freesurfer.longitudinal.cli",
+    "t1-freesurfer-longitudinal-correction": "clinica.pipelines.anatomical.freesurfer.longitudinal.correction.cli",
+    "t1-freesurfer-template": "clinica.pipelines.anatomical.freesurfer.longitudinal.template.cli",
+    "deeplearning-prepare-data": "clinica.pipelines.deeplearning_prepare_data.deeplearning_prepare_data_cli",
+    "dwi-connectome": "clinica.pipelines.dwi.connectome.cli",
+    "dwi-dti": "clinica.pipelines.dwi.dti.cli",
+    "dwi-preprocessing-using-phasediff-fmap": "clinica.pipelines.dwi.preprocessing.fmap.cli",
+    "dwi-preprocessing-using-t1": "clinica.pipelines.dwi.preprocessing.t1.cli",
+    "machinelearning-classification": "clinica.pipelines.machine_learning.classification_cli",
+    "machinelearning-prepare-spatial-svm": "clinica.pipelines.machine_learning_spatial_svm.spatial_svm_cli",
+    "pet-linear": "clinica.pipelines.pet.linear.cli",
+    "pet-volume": "clinica.pipelines.pet.volume.cli",
+    "pet-surface": "clinica.pipelines.pet_surface.pet_surface_cli",
+    "pet-surface-longitudinal": "clinica.pipelines.pet_surface.pet_surface_longitudinal_cli",
+    "statistics-surface": "clinica.pipelines.statistics_surface.cli",
+    "statistics-volume": "clinica.pipelines.statistics_volume.statistics_volume_cli",
+    "statistics-volume-correction": "clinica.pipelines.statistics_volume_correction.statistics_volume_correction_cli",
+    "flair-linear": "clinica.pipelines.t1_linear.flair_linear_cli",
+    "t1-linear": "clinica.pipelines.t1_linear.t1_linear_cli",
+    "t1-volume": "clinica.pipelines.t1_volume.t1_volume_cli",
+    "t1-volume-create-dartel": "clinica.pipelines.t1_volume_create_dartel.t1_volume_create_dartel_cli",
+    "t1-volume-dartel2mni": "clinica.pipelines.t1_volume_dartel2mni.t1_volume_dartel2mni_cli",
+    "t1-volume-existing-template": "clinica.pipelines.t1_volume_existing_template.t1_volume_existing_template_cli",
+    "t1-volume-parcellation": "clinica.pipelines.t1_volume_parcellation.t1_volume_parcellation_cli",
+    "t1-volume-register-dartel": "clinica.pipelines.t1_volume_register_dartel.t1_volume_register_dartel_cli",
+    "t1-volume-tissue-segmentation": "clinica.pipelines.t1_volume_tissue_segmentation.t1_volume_tissue_segmentation_cli",
+    "pydra-machine-learning-prepare-spatial-svm": "clinica.pydra.machine_learning_spatial_svm.spatial_svm_cli",
+    "pydra-pet-linear": "clinica.pydra.pet_linear.pet_linear_cli",
+    "pydra-pet-volume": "clinica.pydra.pet_volume.pet_volume_cli",
+    "pydra-statistics-volume": "clinica.pydra.statistics_volume.statistics_volume_cli",
+    "pydra-statistics-volume-correction": "clinica.pydra.statistics_volume_correction.statistics_volume_correction_cli",
+    "pydra-t1-freesurfer": "clinica.pydra.t1_freesurfer.cli",
+    "pydra-t1-linear": "clinica.pydra.t1_linear.t1_linear_cli",
+    "pydra-t1-volume-create-dartel": "clinica.pydra.t1_volume.create_dartel.cli",
+    "pydra-t1-volume-dartel2mni": "clinica.pydra.t1_volume.dartel2mni.cli",
+    "pydra-t1-volume-register-dartel": "clinica.pydra.t1_volume.register_dartel.cli",
+    "pydra-t1-volume-tissue-segmentation": "clinica.pydra.t1_volume.tissue_segmentation.cli",
+}
+
+# Packages registering pipelines, in the order in which they should be listed.
+PIPELINE_PACKAGES = (
+    "clinica.pydra",
+    "clinica.pipelines.deeplearning_prepare_data",
+    "clinica.pipelines.dwi",
+    "clinica.pipelines.machine_learning",
+    "clinica.pipelines.machine_learning_spatial_svm",
+    "clinica.pipelines.pet",
+    "clinica.pipelines.pet_surface",
+    "clinica.pipelines.statistics_surface",
+    "clinica.pipelines.statistics_volume",
+    "clinica.pipelines.statistics_volume_correction",
+    "clinica.pipelines.anatomical",
+    "clinica.pipelines.t1_linear",
+    "clinica.pipelines.t1_volume",
+    "clinica.pipelines.t1_volume_create_dartel",
+    "clinica.pipelines.t1_volume_dartel2mni",
+    "clinica.pipelines.t1_volume_existing_template",
+    "clinica.pipelines.t1_volume_parcellation",
+    "clinica.pipelines.t1_volume_register_dartel",
+    "clinica.pipelines.t1_volume_tissue_segmentation",
+)
+
+
+def register_all_pipelines() -> None:
+    """Import all pipeline packages such that their commands get registered."""
+    for package in PIPELINE_PACKAGES:
+        importlib.import_module(package)
+
 
 class RegistrationOrderGroup(click.Group):
-    """CLI group which lists commands by order or registration."""
+    """CLI group which lists commands by order or registration.
+
+    Pipelines register themselves when their CLI module is imported
+    (see `clinica_pipeline`). When a single pipeline is requested, only
+    its module is imported. All pipelines are imported when listing them.
+    """
 
     def list_commands(self, ctx):
+        register_all_pipelines()
         return self.commands.keys()
 
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands:
+            if cmd_name in PIPELINE_MODULES:
+                importlib.import_module(PIPELINE_MODULES[cmd_name])
+            else:
+                register_all_pipelines()
+        return super().get_command(ctx, cmd_name)
+
 
 @click.group(cls=RegistrationOrderGroup, name="run")
 def cli() -> None:
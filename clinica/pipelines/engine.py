@@ -1,9 +1,10 @@
 """This module contains the Pipeline abstract class needed for Clinica.
 
-Subclasses are located in clinica/pipeline/<pipeline_name>/<pipeline_name>_pipeline.py
+Subclasses are located in clinica/pipelines/<pipeline_name>/<pipeline_name>_pipeline.py
 """
 
 import abc
+import os
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
@@ -89,8 +90,9 @@ def _detect_cross_sectional_and_longitudinal_subjects(
     cross_sectional_subjects = []
     longitudinal_subjects = []
     for subject in subjects:
-        folders = [f.name for f in (bids_dir / subject).iterdir() if f.is_dir()]
-        if not all([folder.startswith("ses-") for folder in folders]):
+        with os.scandir(bids_dir / subject) as entries:
+            folders = [entry.name for entry in entries if entry.is_dir()]
+        if not all(folder.startswith("ses-") for folder in folders):
             cross_sectional_subjects.append(subject)
         else:
             longitudinal_subjects.append(subject)
@@ -633,6 +635,7 @@ class Pipeline(Workflow):
         message += "\n- ".join([str(visit) for visit in visits_already_processed])
         message += "\nThose visits will be ignored by Clinica."
         log_and_warn(message, UserWarning)
+        visits_already_processed = set(visits_already_processed)
         self.visits = [
             visit for visit in self.visits if visit not in visits_already_processed
         ]
@@ -641,6 +644,24 @@ class Pipeline(Workflow):
         """Examine the files present in the CAPS output folder and return the visits for which processing has already been done."""
         return []
 
+    def _get_processed_image_ids(self) -> set[str]:
+        """Return the IDs ("<subject>_<session>") of the images already processed in CAPS.
+
+        Some pipelines only implement the `get_processed_images` static method
+        instead of `get_processed_visits`, in which case it is used.
+        """
+        if hasattr(self, "get_processed_images"):
+            return set(
+                self.get_processed_images(
+                    caps_directory=self.caps_directory,
+                    subjects=self.subjects,
+                    sessions=self.sessions,
+                )
+            )
+        return {
+            f"{visit.subject}_{visit.session}" for visit in self.get_processed_visits()
+        }
+
     def _init_nodes(self) -> None:
         """Init the basic workflow and I/O nodes necessary before build."""
         self._init_input_node()
@@ -753,7 +774,8 @@ class Pipeline(Workflow):
         if not bypass_check:
             self._check_size()
             plugin_args = self._update_parallelize_info(plugin_args)
-            plugin = "MultiProc"
+            # Spawning a pool of workers is pure overhead with a single process
+            plugin = "MultiProc" if plugin_args["n_procs"] > 1 else "Linear"
         exec_graph = []
         try:
             exec_graph = Workflow.run(self, plugin, plugin_args, update_hash)
@@ -763,16 +785,14 @@ class Pipeline(Workflow):
         except RuntimeError as e:
             # Check that it is a Nipype error
             if "Workflow did not execute cleanly. Check log for details" in str(e):
-                input_ids = [
-                    p_id + "_" + s_id
-                    for p_id, s_id in zip(self.subjects, self.sessions)
+                processed_ids = self._get_processed_image_ids()
+                missing_ids = [
+                    image_id
+                    for image_id in (
+                        f"{visit.subject}_{visit.session}" for visit in self.visits
+                    )
+                    if image_id not in processed_ids
                 ]
-                output_ids = self.get_processed_images(
-                    caps_directory=self.caps_directory,
-                    subjects=self.subjects,
-                    sessions=self.sessions,
-                )
-                missing_ids = list(set(input_ids) - set(output_ids))
                 print_failed_images(self.name, missing_ids)
             else:
                 raise e
@@ -885,7 +905,8 @@ class Pipeline(Workflow):
     def _update_parallelize_info(self, plugin_args: Optional[dict]) -> dict:
         """Performs some checks of the number of threads given in parameters,
         given the number of CPUs of the machine in which clinica is running.
-        We force the use of plugin MultiProc
+        The pipeline is then run with the MultiProc plugin, unless a single
+        process is requested in which case the Linear plugin is used.
 
         Author: Arnaud Marcoux
         """
@@ -939,11 +960,12 @@ class Pipeline(Workflow):
         """
         if self.bids_directory is None:
             return
-        subjects = [
-            f.name
-            for f in self.bids_directory.iterdir()
-            if (self.bids_directory / f).is_dir() and f.name.startswith("sub-")
-        ]
+        with os.scandir(self.bids_directory) as entries:
+            subjects = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("sub-") and entry.is_dir()
+            ]
         (
             cross_sectional_subjects,
             longitudinal_subjects,
@@ -12,6 +12,9 @@ from clinica.utils.stream import log_and_warn
 cfg = dict(execution={"parameterize_dirs": False})
 config.update_config(cfg)
 
+# Static inputs of the nipype RegistrationSynQuick interface (affine, 3D).
+_REGISTRATION_SYN_QUICK_INPUTS = {"transform_type": "a", "dimension": 3}
+
 
 class AnatLinear(Pipeline):
     """Anat Linear - Affine registration of anat (t1w or flair) images to standard space.
@@ -95,9 +98,12 @@ class AnatLinear(Pipeline):
             else T1W_LINEAR_CROPPED,
         )
         visits_having_image = extract_visits(images)
+        if not visits_having_image:
+            return []
+        # Only look for the transformation of visits which already have an image
         transformation, _ = clinica_file_reader(
-            self.subjects,
-            self.sessions,
+            [visit.subject for visit in visits_having_image],
+            [visit.session for visit in visits_having_image],
             self.caps_directory,
             T1W_TO_MNI_TRANSFORM,
         )
@@ -324,13 +330,12 @@ class AnatLinear(Pipeline):
                 else ants.RegistrationSynQuick()
             ),
         )
-        ants_registration_node.inputs.fixed_image = self.ref_template
+        ants_registration_node.inputs.trait_set(
+            fixed_image=self.ref_template,
+            random_seed=self.parameters.get("random_seed", None) or 0,
+        )
         if not self.use_antspy:
-            ants_registration_node.inputs.transform_type = "a"
-            ants_registration_node.inputs.dimension = 3
-
-        random_seed = self.parameters.get("random_seed", None)
-        ants_registration_node.inputs.random_seed = random_seed or 0
+            ants_registration_node.inputs.trait_set(**_REGISTRATION_SYN_QUICK_INPUTS)
 
         # 3. Crop image (using nifti). It uses custom interface, from utils file
 
@@ -1,3 +1,4 @@
+import re
 from os import PathLike
 from pathlib import Path
 from typing import Callable, List, Optional, Union
@@ -26,6 +27,12 @@ __all__ = [
 
 UserProvidedPath = Union[str, PathLike]
 
+# Subject and session labels, joined by "_" in filenames and by "/" in paths.
+_SUBJECT_SESSION_PATTERNS = {
+    sep: re.compile(sep.join([r"(sub-[a-zA-Z0-9]+)", r"(ses-[a-zA-Z0-9]+)"]))
+    for sep in ("_", "/")
+}
+
 
 def zip_nii(in_file: str, same_dir: bool = False) -> str:
     """Compress the provided file(s).
@@ -249,9 +256,7 @@ def save_participants_sessions(
 
 
 def _check_bids_or_caps_compliance(filename: str, sep: str):
-    import re
-
-    m = re.search(sep.join([r"(sub-[a-zA-Z0-9]+)", r"(ses-[a-zA-Z0-9]+)"]), filename)
+    m = _SUBJECT_SESSION_PATTERNS[sep].search(filename)
     if not m:
         raise ValueError(
             f"Input filename {filename} is not in a BIDS or CAPS compliant format."
@@ -343,13 +348,13 @@ def get_filename_no_ext(filename: Union[str, Path]) -> str:
     >>> get_filename_no_ext("sub-01/ses-M000/sub-01_ses-M000.tar.gz")
     'sub-01_ses-M000'
     """
-    if not isinstance(filename, Path):
-        filename = Path(filename)
-    stem = filename.stem
-    while "." in stem:
-        stem = Path(stem).stem
+    import os
 
-    return stem
+    name = os.path.basename(os.path.normpath(os.fspath(filename)))
+    # Leading dots of hidden files are part of the name, not of the extension.
+    extension_start = name.find(".", len(name) - len(name.lstrip(".")))
+
+    return name if extension_start == -1 else name[:extension_start]
 
 
 def extract_image_ids(bids_or_caps_files: list[str]) -> list[str]:
@@ -385,18 +390,21 @@ def extract_image_ids(bids_or_caps_files: list[str]) -> list[str]:
     --------
     get_subject_id
     """
-    id_bids_or_caps_files = []
-    for f in bids_or_caps_files:
-        match = _check_bids_or_caps_compliance(f, sep="_")
-        id_bids_or_caps_files.append(match.group())
+    return [
+        _check_bids_or_caps_compliance(f, sep="_").group() for f in bids_or_caps_files
+    ]
 
-    return id_bids_or_caps_files
+
+def _extract_subjects_sessions(bids_or_caps_files: list[str]) -> list[tuple[str, str]]:
+    return [
+        _check_bids_or_caps_compliance(f, sep="_").groups() for f in bids_or_caps_files
+    ]
 
 
 def extract_visits(bids_or_caps_files: list[str]) -> list[Visit]:
     return [
-        Visit(*image_id.split("_"))
-        for image_id in extract_image_ids(bids_or_caps_files)
+        Visit(subject, session)
+        for subject, session in _extract_subjects_sessions(bids_or_caps_files)
     ]
 
 
@@ -430,10 +438,9 @@ def extract_subjects_sessions_from_filename(
     --------
     extract_image_ids
     """
-    id_bids_or_caps_files = extract_image_ids(bids_or_caps_files)
-    split = [image_id.split("_") for image_id in id_bids_or_caps_files]
-    subject_ids = [p_id[0] for p_id in split]
-    session_ids = [s_id[1] for s_id in split]
+    subjects_sessions = _extract_subjects_sessions(bids_or_caps_files)
+    subject_ids = [subject for subject, _ in subjects_sessions]
+    session_ids = [session for _, session in subjects_sessions]
     return subject_ids, session_ids
 
 
@@ -450,7 +457,6 @@ def extract_crash_files_from_log_file(filename: str) -> list[str]:
     crash_files: List[str]
         List of crash files.
     """
-    import re
     from pathlib import Path
 
     filename = Path(filename)
@@ -461,7 +467,7 @@ def extract_crash_files_from_log_file(filename: str) -> list[str]:
     crash_files = []
     with open(filename, "r") as log_file:
         for line in log_file:
-            if re.match("(.*)crashfile:(.*)", line):
+            if "crashfile:" in line:
                 crash_files.append(line.replace("\t crashfile:", "").replace("\n", ""))
 
     return crash_files
@@ -556,15 +562,12 @@ def _get_folder_size(folder: Union[str, Path]) -> int:
     52571
     """
     import os
-    from functools import partial
-
-    prepend = partial(os.path.join, folder)
-    return sum(
-        [
-            (os.path.getsize(f) if os.path.isfile(f) else _get_folder_size(f))
-            for f in map(prepend, os.listdir(folder))
-        ]
-    )
+
+    with os.scandir(folder) as entries:
+        return sum(
+            (entry.stat().st_size if entry.is_file() else _get_folder_size(entry.path))
+            for entry in entries
+        )
 
 
 def _get_folder_size_human(folder: Union[str, Path]) -> str:
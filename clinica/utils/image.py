@@ -528,7 +528,7 @@ def crop_nifti(
             f"{reference_image.shape} of the reference template {reference_image.path}."
         )
     output_img = (
-        output_dir or Path.cwd()
+        Path(output_dir) if output_dir else Path.cwd()
     ) / f"{input_image.get_filename(with_extension=False)}_cropped.nii.gz"
     crop_img.to_filename(output_img)
 
@@ -537,7 +537,7 @@ def crop_nifti(
 
 def crop_nifti_using_t1_mni_template(
     input_image: Union[str, Path, NiftiImage3D],
-    output_dir: Optional[Path] = None,
+    output_dir: Optional[Union[str, Path]] = None,
 ) -> Path:
     """The function expects a 3D anatomical image and will crop it using a pre-computed bounding box.
 
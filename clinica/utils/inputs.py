@@ -1,11 +1,14 @@
 """This module contains utilities to grab or download files for Clinica."""
 
+import fnmatch
 import hashlib
+import itertools
 import os
+import re
 from collections import namedtuple
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Sequence, Union
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
 
 __all__ = [
     "RemoteFileStructure",
@@ -25,6 +28,11 @@ __all__ = [
 RemoteFileStructure = namedtuple("RemoteFileStructure", ["filename", "url", "checksum"])
 InvalidSubjectSession = namedtuple("InvalidSubjectSession", ["subject", "session"])
 
+_RUN_NUMBER_PATTERN = re.compile(r".*_run-(\d+).*")
+
+# Number of files listed in the error raised by `clinica_group_reader` when a pattern is ambiguous
+_MAX_REPORTED_GROUP_FILES = 10
+
 
 def insensitive_glob(pattern_glob: str, recursive: Optional[bool] = False) -> list[str]:
     """This function is the glob.glob() function that is insensitive to the case.
@@ -94,16 +102,60 @@ def find_images_path(
     pattern : str
         Define the pattern of the final file.
     """
-    from clinica.utils.stream import cprint
+    origin_pattern = _get_visit_folder(input_directory, subject, session, is_bids)
+    _add_found_image(
+        _find_files(origin_pattern, pattern), subject, session, errors, valid_paths
+    )
 
-    input_directory = Path(input_directory)
-    if is_bids:
-        origin_pattern = input_directory / subject / session
-    else:
-        origin_pattern = input_directory / "subjects" / subject / session
 
-    current_pattern = origin_pattern / "**" / pattern
-    current_glob_found = insensitive_glob(str(current_pattern), recursive=True)
+def _get_visit_folder(
+    input_directory: os.PathLike, subject: str, session: str, is_bids: bool
+) -> Path:
+    """Return the folder of the visit in the BIDS or CAPS `input_directory`.
+
+    As when the whole path was matched with `insensitive_glob`, the subject
+    and session folders (and the "subjects" folder of a CAPS) are looked for
+    ignoring case, such that labels only differing in case from the folder
+    names still find the visit.
+    """
+    folder = Path(input_directory)
+    for name in ([subject, session] if is_bids else ["subjects", subject, session]):
+        folder = _get_child_ignoring_case(folder, name)
+    return folder
+
+
+def _get_child_ignoring_case(folder: Path, name: str) -> Path:
+    """Return `folder / name`, or the entry of `folder` whose name only differs in case.
+
+    The exact name is preferred when it exists. If several entries only differ
+    in case, the first one in sorted order is used. If none matches, `folder / name`
+    is returned as is, which is then found to be empty.
+    """
+    path = folder / name
+    if path.exists():
+        return path
+    try:
+        with os.scandir(folder) as entries:
+            matches = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.casefold() == name.casefold()
+            )
+    except OSError:
+        return path
+    return folder / matches[0] if matches else path
+
+
+def _add_found_image(
+    current_glob_found: list[str],
+    subject: str,
+    session: str,
+    errors: list[InvalidSubjectSession],
+    valid_paths: list[str],
+) -> None:
+    """Add the image found for the visit to `valid_paths`, or the visit to `errors`."""
+    from clinica.utils.stream import cprint
+
     if len(current_glob_found) > 1:
         # If we have more than one file at this point, there are two possibilities:
         #   - there is a problem somewhere which made us catch too many files
@@ -133,6 +185,154 @@ def find_images_path(
         valid_paths.append(current_glob_found[0])
 
 
+def _find_files(
+    folder: Path, pattern: str, index: Optional[Iterable[tuple[str, ...]]] = None
+) -> list[str]:
+    """Return the paths below `folder` matching `pattern` at any depth, ignoring case.
+
+    This matches the same paths below `folder` as
+    `insensitive_glob(str(folder / "**" / pattern), recursive=True)`, except
+    that `folder` itself is used as is instead of being matched ignoring case
+    (see `_get_visit_folder` for visit folders). The folder is walked once with
+    `os.scandir` and the pattern is compiled once, instead of letting `glob`
+    match a per-character case-insensitive pattern against each directory it lists.
+
+    The content of `folder`, as returned by `_walk_folder`, can be provided
+    through `index` when several patterns are looked for in the same folder.
+    """
+    return list(_iter_files(folder, pattern, index))
+
+
+def _iter_files(
+    folder: Path, pattern: str, index: Optional[Iterable[tuple[str, ...]]] = None
+) -> Iterator[str]:
+    """Lazily yield the paths which `_find_files` returns, as the folder is walked."""
+    segments = _compile_pattern(str(Path("**") / pattern))
+    hint = _get_literal_hint(Path(pattern).name)
+    name_filter = (
+        (lambda name: not name.isascii() or hint in name.lower()) if hint else None
+    )
+    if index is None:
+        index = _walk_folder(
+            folder,
+            skip_hidden=not _matches_hidden_names(pattern),
+            name_filter=name_filter,
+        )
+    elif name_filter:
+        index = (parts for parts in index if name_filter(parts[-1]))
+    for parts in index:
+        if _match_parts(parts, segments):
+            yield os.path.join(folder, *parts)
+
+
+def _matches_hidden_names(pattern: str) -> bool:
+    """Return whether `pattern` can match paths containing hidden files or folders.
+
+    As with `glob`, only path components starting with a dot match hidden names.
+    """
+    return any(segment.startswith(".") for segment in Path(pattern).parts)
+
+
+def _get_literal_hint(segment: str) -> str:
+    """Return the longest wildcard-free part of a glob segment, in lower case.
+
+    Any name matched by the segment contains this text, so it can be used to
+    discard most names with a substring test before running the regex.
+    An empty string is returned when there is no usable hint.
+
+    Examples
+    --------
+    >>> _get_literal_hint("sub-*_ses-*_T1w.nii*")
+    '_t1w.nii'
+    >>> _get_literal_hint("*")
+    ''
+    """
+    if "[" in segment or not segment.isascii():
+        return ""
+    return max(re.split(r"[*?]", segment), key=len).lower()
+
+
+def _walk_folder(
+    folder: Path,
+    skip_hidden: bool = False,
+    name_filter: Optional[Callable[[str], bool]] = None,
+) -> Iterator[tuple[str, ...]]:
+    """Yield the relative paths, split into components, of everything below `folder`.
+
+    Symbolic links to directories are followed and unreadable directories are
+    skipped, as with `os.walk(folder, followlinks=True)`.
+    If `skip_hidden` is True, hidden files are not yielded and hidden
+    directories are not walked into.
+    If `name_filter` is provided, only the entries whose name passes it are
+    yielded, but all directories are still walked into.
+    """
+    stack = [(str(folder), ())]
+    while stack:
+        path, parts = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if skip_hidden and name.startswith("."):
+                    continue
+                keep = name_filter is None or name_filter(name)
+                is_dir = entry.is_dir()
+                if not (keep or is_dir):
+                    continue
+                entry_parts = parts + (name,)
+                if keep:
+                    yield entry_parts
+                if is_dir:
+                    stack.append((entry.path, entry_parts))
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> tuple[Optional[re.Pattern], ...]:
+    """Compile a glob pattern into one case-insensitive regex per path component.
+
+    The recursive wildcard "**" is represented by None. As with `glob`,
+    components which do not start with a dot do not match hidden names.
+
+    Readers call this once per subject and session with the same few patterns,
+    so compiled patterns are cached.
+    """
+    return tuple(
+        (
+            None
+            if segment == "**"
+            else re.compile(
+                ("" if segment.startswith(".") else r"(?!\.)")
+                + fnmatch.translate(segment),
+                re.IGNORECASE,
+            )
+        )
+        for segment in Path(pattern).parts
+    )
+
+
+def _match_parts(
+    parts: tuple[str, ...], segments: tuple[Optional[re.Pattern], ...]
+) -> bool:
+    """Check whether the path components `parts` match the compiled `segments`."""
+    if not segments:
+        return not parts
+    if segments[0] is None:
+        for n_consumed in range(len(parts) + 1):
+            if _match_parts(parts[n_consumed:], segments[1:]):
+                return True
+            if n_consumed < len(parts) and parts[n_consumed].startswith("."):
+                return False
+        return False
+    return (
+        len(parts) > 0
+        and segments[0].match(parts[0]) is not None
+        and _match_parts(parts[1:], segments[1:])
+    )
+
+
 def _are_multiple_runs(files: list[str]) -> bool:
     """Returns whether the files in the provided list only differ through their run number.
 
@@ -282,16 +482,11 @@ _check_common_suffix = partial(
 
 
 def _select_run(files: list[str]) -> str:
-    import numpy as np
-
-    runs = [int(_get_run_number(f)) for f in files]
-    return files[np.argmax(runs)]
+    return max(files, key=lambda f: int(_get_run_number(f)))
 
 
 def _get_run_number(filename: str) -> str:
-    import re
-
-    matches = re.match(r".*_run-(\d+).*", filename)
+    matches = _RUN_NUMBER_PATTERN.match(filename)
     if matches:
         return matches[1]
     raise ValueError(f"Filename {filename} should contain one and only one run entity.")
@@ -558,27 +753,16 @@ def _read_files_parallel(
     pattern: str,
     n_procs: int,
 ) -> tuple[list[str], list[InvalidSubjectSession]]:
-    from multiprocessing import Manager
-
     from joblib import Parallel, delayed
 
-    manager = Manager()
-    shared_results = manager.list()
-    shared_errors_encountered = manager.list()
-    Parallel(n_jobs=n_procs)(
-        delayed(find_images_path)(
-            input_directory,
-            sub,
-            ses,
-            shared_errors_encountered,
-            shared_results,
-            is_bids,
-            pattern,
-        )
+    # Looking for files mostly waits on the filesystem: threads avoid spawning workers
+    # and proxying results through a Manager, and results keep the order of the visits.
+    per_visit = Parallel(n_jobs=n_procs, prefer="threads")(
+        delayed(_read_files_sequential)(input_directory, [sub], [ses], is_bids, pattern)
         for sub, ses in zip(subjects, sessions)
     )
-    results = list(shared_results)
-    errors_encountered = list(shared_errors_encountered)
+    results = [file for files, _ in per_visit for file in files]
+    errors_encountered = [error for _, errors in per_visit for error in errors]
     return results, errors_encountered
 
 
@@ -607,8 +791,9 @@ def clinica_list_of_files_reader(
 ) -> list[list[str]]:
     """Read list of BIDS or CAPS files.
 
-    This function iterates calls of `clinica_file_reader` to extract input files based
-    on information given by `list_information`.
+    This function extracts input files based on information given by `list_information`,
+    as successive calls of `clinica_file_reader` would, but the folder of each
+    visit is only walked once for all the patterns.
 
     Parameters
     ----------
@@ -634,19 +819,38 @@ def clinica_list_of_files_reader(
     list_found_files : List[List[str]]
         List of lists of found files following order of `list_information`
     """
+    from clinica.dataset import DatasetType, check_dataset, get_dataset_type
+
     from .exceptions import ClinicaBIDSError
 
-    all_errors = []
-    list_found_files = []
+    list_information = list(list_information)
     for info_file in list_information:
-        files, errors = clinica_file_reader(
-            participant_ids,
-            session_ids,
-            bids_or_caps_directory,
-            info_file,
-        )
-        all_errors.append(errors)
-        list_found_files.append([] if errors else files)
+        _check_information(info_file)
+    bids_or_caps_directory = Path(bids_or_caps_directory)
+    check_dataset(bids_or_caps_directory)
+    if len(participant_ids) != len(session_ids):
+        raise ValueError("Subjects and sessions must have the same length.")
+    is_bids = get_dataset_type(bids_or_caps_directory) == DatasetType.RAW
+    skip_hidden = not any(
+        _matches_hidden_names(info_file["pattern"]) for info_file in list_information
+    )
+
+    all_files = [[] for _ in list_information]
+    all_errors = [[] for _ in list_information]
+    for subject, session in zip(participant_ids, session_ids):
+        folder = _get_visit_folder(bids_or_caps_directory, subject, session, is_bids)
+        index = list(_walk_folder(folder, skip_hidden=skip_hidden))
+        for info_file, files, errors in zip(list_information, all_files, all_errors):
+            _add_found_image(
+                _find_files(folder, info_file["pattern"], index),
+                subject,
+                session,
+                errors,
+                files,
+            )
+    list_found_files = [
+        [] if errors else files for files, errors in zip(all_files, all_errors)
+    ]
 
     if any(all_errors) and raise_exception:
         error_message = "Clinica faced error(s) while trying to read files in your BIDS or CAPS directory.\n"
@@ -665,7 +869,7 @@ def clinica_group_reader(
     """Read files from CAPS directory based on group ID(s).
 
     This function grabs files relative to a group, according to a glob pattern (using *).
-    Only one file can be returned, as order is arbitrary in `glob.glob()`.
+    Only one file can be returned, as the order in which files are found is arbitrary.
 
     Parameters
     ----------
@@ -703,8 +907,15 @@ def clinica_group_reader(
     caps_directory = Path(caps_directory)
     check_caps_dataset(caps_directory)
 
-    current_pattern = caps_directory / "**" / pattern
-    found_files = insensitive_glob(str(current_pattern), recursive=True)
+    # Only the first file is returned, so the walk stops at the first match when not
+    # raising. Otherwise a second match is already an error, and only a bounded
+    # number of matches are collected to be listed in its message.
+    found_files = list(
+        itertools.islice(
+            _iter_files(caps_directory, pattern),
+            _MAX_REPORTED_GROUP_FILES if raise_exception else 1,
+        )
+    )
 
     # Since we are returning found_files[0], force raising even if raise_exception is False
     # Otherwise we'll get an uninformative IndexError...
@@ -728,7 +939,11 @@ def _format_and_raise_group_reader_errors(
     if len(found_files) == 0:
         error_string += "No file was found"
     else:
-        error_string += f"{len(found_files)} files were found:"
+        error_string += (
+            f"At least {len(found_files)} files were found:"
+            if len(found_files) >= _MAX_REPORTED_GROUP_FILES
+            else f"{len(found_files)} files were found:"
+        )
         for found_file in found_files:
             error_string += f"\n\t{found_file}"
         error_string += (
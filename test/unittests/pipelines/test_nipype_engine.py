@@ -66,3 +66,146 @@ def test_convert_cross_sectional(tmp_path):
                 / "anat"
                 / f"{subject}_ses-M000_T1w{extension}"
             ).exists()
+
+
+def _build_bids_with_t1w_images(directory: Path) -> Path:
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.utils.testing_utils import build_bids_directory
+
+    bids = build_bids_directory(
+        directory, {"sub-01": ["ses-M000", "ses-M006"], "sub-02": ["ses-M000"]}
+    )
+    for t1w in bids.rglob("*_T1w.nii.gz"):
+        nib.Nifti1Image(np.zeros((4, 4, 4)), np.eye(4)).to_filename(t1w)
+    return bids
+
+
+def _run_pipeline_failing_after_processing(mocker, pipeline, processed_files):
+    """Run the pipeline with a workflow which only writes `processed_files` before failing."""
+
+    def _failing_run(*args, **kwargs):
+        for processed_file in processed_files:
+            processed_file.parent.mkdir(parents=True, exist_ok=True)
+            processed_file.touch()
+        raise RuntimeError("Workflow did not execute cleanly. Check log for details")
+
+    mocker.patch("clinica.pipelines.engine.Workflow.run", side_effect=_failing_run)
+    print_failed_images = mocker.patch("clinica.utils.ux.print_failed_images")
+
+    pipeline.run(bypass_check=True)
+
+    return print_failed_images
+
+
+def test_run_reports_failed_images_from_processed_images(tmp_path, mocker):
+    """T1FreeSurfer only implements `get_processed_images`."""
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+    from clinica.utils.check_dependency import ThirdPartySoftware
+    from clinica.utils.testing_utils import build_caps_directory
+
+    bids = _build_bids_with_t1w_images(tmp_path / "bids")
+    caps = build_caps_directory(tmp_path / "caps", {})
+    pipeline = T1FreeSurfer(
+        bids_directory=str(bids),
+        caps_directory=str(caps),
+        base_dir=str(tmp_path / "wd"),
+        parameters={"recon_all_args": "-qcache", "skip_question": True},
+        ignore_dependencies=[ThirdPartySoftware.FREESURFER],
+    )
+
+    print_failed_images = _run_pipeline_failing_after_processing(
+        mocker,
+        pipeline,
+        [
+            caps
+            / "subjects"
+            / "sub-01"
+            / "ses-M000"
+            / "t1"
+            / "freesurfer_cross_sectional"
+            / "sub-01_ses-M000"
+            / "mri"
+            / "aparc.a2009s+aseg.mgz"
+        ],
+    )
+
+    print_failed_images.assert_called_once_with(
+        "T1FreeSurfer", ["sub-01_ses-M006", "sub-02_ses-M000"]
+    )
+
+
+def test_run_reports_failed_images_from_processed_visits(tmp_path, mocker):
+    """AnatLinear implements `get_processed_visits`."""
+    from clinica.pipelines.t1_linear.anat_linear_pipeline import AnatLinear
+    from clinica.utils.testing_utils import build_caps_directory
+
+    mocker.patch(
+        "clinica.utils.image._get_file_locally_or_download",
+        return_value=tmp_path / "mni.nii",
+    )
+    bids = _build_bids_with_t1w_images(tmp_path / "bids")
+    caps = build_caps_directory(tmp_path / "caps", {})
+    pipeline = AnatLinear(
+        bids_directory=str(bids),
+        caps_directory=str(caps),
+        base_dir=str(tmp_path / "wd"),
+        parameters={"uncropped_image": False},
+        name="t1-linear",
+        use_antspy=True,
+    )
+    output_folder = caps / "subjects" / "sub-01" / "ses-M000" / "t1_linear"
+
+    print_failed_images = _run_pipeline_failing_after_processing(
+        mocker,
+        pipeline,
+        [
+            output_folder
+            / "sub-01_ses-M000_space-MNI152NLin2009cSym_desc-Crop_res-1x1x1_T1w.nii.gz",
+            output_folder
+            / "sub-01_ses-M000_space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
+        ],
+    )
+
+    print_failed_images.assert_called_once_with(
+        "t1-linear", ["sub-01_ses-M006", "sub-02_ses-M000"]
+    )
+
+
+@pytest.mark.parametrize(
+    "n_procs, expected_plugin", [(1, "Linear"), (2, "MultiProc"), (4, "MultiProc")]
+)
+def test_run_plugin_from_number_of_processes(
+    tmp_path, mocker, n_procs, expected_plugin
+):
+    from clinica.pipelines.t1_linear.anat_linear_pipeline import AnatLinear
+    from clinica.utils.testing_utils import build_caps_directory
+
+    mocker.patch(
+        "clinica.utils.image._get_file_locally_or_download",
+        return_value=tmp_path / "mni.nii",
+    )
+    mocker.patch(
+        "clinica.pipelines.engine.Pipeline._update_parallelize_info",
+        side_effect=lambda plugin_args: plugin_args,
+    )
+    workflow_run = mocker.patch(
+        "clinica.pipelines.engine.Workflow.run", return_value=[]
+    )
+    bids = _build_bids_with_t1w_images(tmp_path / "bids")
+    caps = build_caps_directory(tmp_path / "caps", {})
+    pipeline = AnatLinear(
+        bids_directory=str(bids),
+        caps_directory=str(caps),
+        base_dir=str(tmp_path / "wd"),
+        parameters={"uncropped_image": False},
+        name="t1-linear",
+        use_antspy=True,
+    )
+
+    pipeline.run(plugin_args={"n_procs": n_procs})
+
+    workflow_run.assert_called_once_with(
+        pipeline, expected_plugin, {"n_procs": n_procs}, False
+    )
@@ -0,0 +1,18 @@
+import pytest
+
+
+def test_pipeline_modules_cover_registered_pipelines():
+    from clinica.pipelines.cli import PIPELINE_MODULES, cli, register_all_pipelines
+
+    register_all_pipelines()
+
+    assert set(PIPELINE_MODULES) == set(cli.commands)
+
+
+@pytest.mark.parametrize("name", ["t1-linear", "pet-linear", "pydra-t1-linear"])
+def test_pipeline_command_is_loaded_on_demand(name):
+    import click
+
+    from clinica.pipelines.cli import cli
+
+    assert cli.get_command(click.Context(cli), name).name == name
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from clinica.cmdline import cli
+
+
+@pytest.mark.parametrize("name", ["convert", "generate", "iotools", "run"])
+def test_lazy_subcommand_short_help(name):
+    ctx = click.Context(cli)
+    _, short_help = cli.lazy_subcommands[name]
+
+    # click truncates short helps to 45 characters by default.
+    assert short_help == cli.get_command(ctx, name).get_short_help_str(
+        limit=len(short_help)
+    )
+
+
+def test_cli_help_lists_lazy_subcommands():
+    result = CliRunner().invoke(cli, ["-h"])
+
+    assert result.exit_code == 0
+    for name, (_, short_help) in cli.lazy_subcommands.items():
+        assert name in result.output
+        assert short_help in result.output
+
+
+def test_cli_help_does_not_import_pipelines():
+    # The check runs in a fresh interpreter since the test session
+    # may already have imported the modules.
+    script = "\n".join(
+        [
+            "import sys",
+            "from click.testing import CliRunner",
+            "from clinica.cmdline import cli",
+            "result = CliRunner().invoke(cli, ['-h'])",
+            "assert result.exit_code == 0, result.output",
+            "imported = [",
+            "    name for name in sys.modules",
+            "    if name.split('.')[0] == 'nipype'",
+            "    or name == 'clinica.pipelines'",
+            "    or name.startswith('clinica.pipelines.')",
+            "]",
+            "assert not imported, imported",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -158,6 +158,11 @@ def test_get_subject_id(filename, expected):
         ("foo.nii.gz", "foo"),
         ("sub-01/ses-M000/sub-01_ses-M000.tar.gz", "sub-01_ses-M000"),
         ("foo/bar/baz/foo-bar_baz.niml.dset", "foo-bar_baz"),
+        (Path("foo/bar.nii"), "bar"),
+        ("foo/bar", "bar"),
+        ("foo/.bar.json", ".bar"),
+        ("a/b/", "b"),
+        ("a/b.tar.gz/", "b"),
     ],
 )
 def test_get_filename_no_ext(filename, expected):
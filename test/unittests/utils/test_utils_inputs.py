@@ -280,6 +280,72 @@ def test_insensitive_glob(tmp_path):
     }
 
 
+def _build_find_files_tree(folder: Path) -> None:
+    for file in (
+        "foo.py",
+        "Bar.txt",
+        "Fooo.PY",
+        ".hidden.py",
+        "folder_1/foo1.py",
+        "folder_2/sub/BaR2.PY",
+        ".folder/foo2.py",
+    ):
+        (folder / file).parent.mkdir(parents=True, exist_ok=True)
+        (folder / file).touch()
+
+
+FIND_FILES_CASES = [
+    ("*.py", {"foo.py", "Fooo.PY", "folder_1/foo1.py", "folder_2/sub/BaR2.PY"}),
+    ("folder_*/*.py", {"folder_1/foo1.py"}),
+    ("sub/*.py", {"folder_2/sub/BaR2.PY"}),
+    ("FOLDER_2/**/*.py", {"folder_2/sub/BaR2.PY"}),
+    ("*.txt", {"Bar.txt"}),
+    ("*.json", set()),
+    (".hidden*", {".hidden.py"}),
+    (".folder/*.py", {".folder/foo2.py"}),
+    ("folder_*", {"folder_1", "folder_2"}),
+]
+
+
+@pytest.mark.parametrize("pattern,expected", FIND_FILES_CASES)
+def test_find_files(tmp_path, pattern, expected):
+    from clinica.utils.inputs import _find_files
+
+    _build_find_files_tree(tmp_path)
+
+    assert {
+        Path(f).relative_to(tmp_path).as_posix() for f in _find_files(tmp_path, pattern)
+    } == expected
+
+
+@pytest.mark.parametrize("pattern", [pattern for pattern, _ in FIND_FILES_CASES])
+def test_find_files_same_as_insensitive_glob(tmp_path, pattern):
+    from clinica.utils.inputs import _find_files, insensitive_glob
+
+    _build_find_files_tree(tmp_path)
+
+    assert sorted(_find_files(tmp_path, pattern)) == sorted(
+        insensitive_glob(str(tmp_path / "**" / pattern), recursive=True)
+    )
+
+
+@pytest.mark.parametrize(
+    "segment,expected",
+    [
+        ("sub-*_ses-*_T1w.nii*", "_t1w.nii"),
+        ("*_pet.nii.gz", "_pet.nii.gz"),
+        ("foo?.json", ".json"),
+        ("*", ""),
+        ("**", ""),
+        ("sub-[0-9]*.nii", ""),
+    ],
+)
+def test_get_literal_hint(segment, expected):
+    from clinica.utils.inputs import _get_literal_hint
+
+    assert _get_literal_hint(segment) == expected
+
+
 def test_find_images_path_error_no_file(tmp_path):
     """Test function `find_images_path`."""
     from clinica.utils.inputs import find_images_path
@@ -337,6 +403,32 @@ def test_find_images_path(tmp_path):
     )
 
 
+@pytest.mark.parametrize(
+    "is_bids,visit_folder",
+    [
+        (True, Path("sub-01") / "ses-m000"),
+        (True, Path("SUB-01") / "ses-M000"),
+        (False, Path("subjects") / "sub-01" / "ses-m000"),
+        (False, Path("Subjects") / "sub-01" / "ses-M000"),
+    ],
+)
+def test_find_images_path_visit_folder_case(tmp_path, is_bids, visit_folder):
+    """Subject and session labels only differing in case from the folders find the visit."""
+    from clinica.utils.inputs import find_images_path
+
+    image = tmp_path / visit_folder / "anat" / "sub-01_ses-m000_T1w.nii.gz"
+    image.parent.mkdir(parents=True)
+    image.touch()
+    errors, results = [], []
+
+    find_images_path(
+        tmp_path, "sub-01", "ses-M000", errors, results, is_bids, "*_T1w.nii*"
+    )
+
+    assert errors == []
+    assert results == [str(image)]
+
+
 def test_find_images_path_multiple_runs(tmp_path):
     from clinica.utils.inputs import find_images_path
 
@@ -478,7 +570,12 @@ def test_clinica_file_reader_bids_directory(tmp_path, data_type):
         information,
         n_procs=4,
     )
-    assert len(results) == 4
+    assert [Path(result).relative_to(tmp_path).parts[:2] for result in results] == [
+        ("sub-01", "ses-M00"),
+        ("sub-02", "ses-M00"),
+        ("sub-02", "ses-M06"),
+        ("sub-06", "ses-M00"),
+    ]
     assert not errors
 
     (
@@ -721,3 +818,25 @@ def test_clinica_group_reader(tmp_path):
         clinica_group_reader(tmp_path, information, raise_exception=True)
     result = clinica_group_reader(tmp_path, information, raise_exception=False)
     assert Path(result).stem == "group-UnitTest_template.nii"
+
+
+def test_clinica_group_reader_stops_listing_ambiguous_files(tmp_path, mocker):
+    from clinica.utils.inputs import clinica_group_reader
+
+    mocker.patch("clinica.utils.inputs._MAX_REPORTED_GROUP_FILES", 3)
+    build_caps_directory(tmp_path, {"sub-01": ["ses-M00"]})
+    for i in range(5):
+        (tmp_path / "groups" / "group-UnitTest" / f"template_{i}.nii.gz").mkdir(
+            parents=True
+        )
+    information = {
+        "pattern": os.path.join("group-UnitTest", "template_*.nii*"),
+        "description": "template",
+        "needed_pipeline": "t1-volume",
+    }
+
+    with pytest.raises(ClinicaCAPSError) as error:
+        clinica_group_reader(tmp_path, information, raise_exception=True)
+
+    assert "At least 3 files were found" in str(error.value)
+    assert str(error.value).count("template_") == 3